@@ -1,3 +1,3 @@
-from hrid.hrid import HRID
+from hrid.hrid import HRID, get_hrid
 from hrid.word_lists import WORD_LISTS
 from hrid.word_lists.nice import WORD_LISTS as NICE_WORD_LISTS
@@ -1,3 +1,4 @@
+import functools
 import math
 import random
 from typing import Iterable
@@ -5,18 +6,6 @@ from typing import Iterable
 from hrid.word_lists import WORD_LISTS as DEFAULT_WORD_LISTS
 
 
-def _mod_inverse(a: int, m: int) -> int:
-    """Compute modular multiplicative inverse using extended Euclidean algorithm."""
-    def extended_gcd(a: int, b: int) -> tuple[int, int, int]:
-        if a == 0:
-            return b, 0, 1
-        gcd, x1, y1 = extended_gcd(b % a, a)
-        return gcd, y1 - (b // a) * x1, x1
-
-    _, x, _ = extended_gcd(a % m, m)
-    return (x % m + m) % m
-
-
 class HRID:
     DEFAULT_ELEMENTS = ('adjective', 'noun', 'verb', 'adverb')
 
@@ -58,10 +47,21 @@ class HRID:
         self._scramble_seed = scramble_seed
 
         # Compute total space size and scrambling parameters
-        self._space_size = math.prod(len(e) for e in self._elements)
+        self._bases = [len(e) for e in self._elements]
+        space_size = 1
+        for base in self._bases:
+            space_size *= base
+        self._space_size = space_size
+        self._max_n = space_size - 1
         # Choose a scramble multiplier coprime to space_size
         self._scramble_multiplier = self._find_coprime(self._space_size, scramble_seed)
-        self._scramble_inverse = _mod_inverse(self._scramble_multiplier, self._space_size)
+        self._scramble_inverse = pow(self._scramble_multiplier, -1, self._space_size)
+
+        # Least significant digit first, so encode can fill parts from the tail
+        self._n_elements = len(self._elements)
+        self._encode_plan = tuple(zip(reversed(self._elements), reversed(self._bases)))
+        # Word -> index lookups for decode, built on first use
+        self._decode_maps = None
 
     def _find_coprime(self, n: int, seed: str | None = None) -> int:
         """Find a number coprime to n for scrambling distribution.
@@ -119,13 +119,29 @@ class HRID:
 
         :return: A string representing a human-readable ID
         """
-        words = [self.random.choice(e) for e in self._elements]
-        return self.delimiter.join(words)
+        # Resolved per call rather than in __init__ so reassigning self.random still takes effect
+        choice = self.random.choice
+        return self.delimiter.join([choice(e) for e in self._elements])
+
+    def generate_many(self, k: int) -> list[str]:
+        """
+        Generates k human-readable IDs in one call.
+
+        Produces the same IDs as calling generate k times in a row, with the per-call attribute
+        lookups hoisted out of the loop.
+
+        :param k: The number of IDs to generate.
+        :return: A list of k human-readable ID strings
+        """
+        choice = self.random.choice
+        join = self.delimiter.join
+        elements = self._elements
+        return [join([choice(e) for e in elements]) for _ in range(k)]
 
     @property
     def max_value(self) -> int:
         """Return the maximum encodable value (space_size - 1)."""
-        return self._space_size - 1
+        return self._max_n
 
     def encode(self, n: int) -> str:
         """
@@ -139,7 +155,7 @@ class HRID:
         :return: A human-readable ID string
         :raises ValueError: If n is out of range
         """
-        if not 0 <= n < self._space_size:
+        if n < 0 or n > self._max_n:
             raise ValueError(
                 f"Value {n} out of range. Must be 0 <= n < {self._space_size}"
             )
@@ -149,12 +165,13 @@ class HRID:
             n = (n * self._scramble_multiplier) % self._space_size
 
         # Convert to mixed-radix representation
-        parts = []
-        for words in reversed(self._elements):
-            base = len(words)
-            parts.append(words[n % base])
-            n //= base
-        return self.delimiter.join(reversed(parts))
+        parts = [None] * self._n_elements
+        i = self._n_elements - 1
+        for words, base in self._encode_plan:
+            n, r = divmod(n, base)
+            parts[i] = words[r]
+            i -= 1
+        return self.delimiter.join(parts)
 
     def decode(self, hrid: str) -> int:
         """
@@ -165,22 +182,94 @@ class HRID:
         :raises ValueError: If any word in the ID is not found in the corresponding word list
         """
         parts = hrid.split(self.delimiter)
-        if len(parts) != len(self._elements):
+        if len(parts) != self._n_elements:
             raise ValueError(
-                f"Expected {len(self._elements)} parts, got {len(parts)}"
+                f"Expected {self._n_elements} parts, got {len(parts)}"
             )
 
+        decode_maps = self._decode_maps
+        if decode_maps is None:
+            # Word -> index lookups, built back to front so duplicated words keep their first index
+            decode_maps = self._decode_maps = [
+                {words[i]: i for i in range(base - 1, -1, -1)}
+                for words, base in zip(self._elements, self._bases)
+            ]
+
         # Convert from mixed-radix representation
         n = 0
-        for part, words in zip(parts, self._elements):
-            try:
-                idx = words.index(part)
-            except ValueError:
-                raise ValueError(f"Word '{part}' not found in word list") from None
-            n = n * len(words) + idx
+        for part, word_map, base in zip(parts, decode_maps, self._bases):
+            idx = word_map.get(part)
+            if idx is None:
+                raise ValueError(f"Word '{part}' not found in word list")
+            n = n * base + idx
 
         # Reverse scrambling if enabled
         if self._scramble:
             n = (n * self._scramble_inverse) % self._space_size
 
         return n
+
+
+class _ByIdentity:
+    """Hashable wrapper comparing the wrapped object by identity, for use as a cache key."""
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj: object) -> None:
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ByIdentity) and other.obj is self.obj
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_hrid(
+    delimiter: str,
+    elements: tuple | None,
+    word_lists: _ByIdentity,
+    scramble: bool,
+    scramble_seed: str | None,
+) -> HRID:
+    return HRID(
+        delimiter=delimiter,
+        elements=elements,
+        word_lists=word_lists.obj,
+        scramble=scramble,
+        scramble_seed=scramble_seed,
+    )
+
+
+def get_hrid(
+    delimiter: str = '-',
+    elements: Iterable[str] | None = None,
+    word_lists: dict[str, list[str]] | None = None,
+    scramble: bool = True,
+    scramble_seed: str | None = None,
+) -> HRID:
+    """
+    Returns a shared HRID instance for the given configuration, building it on first use.
+
+    Useful when an HRID is needed per request (e.g. HRID(scramble_seed=model_name)) for
+    encode/decode, as repeated calls skip the coprime search and decode map construction.
+
+    Elements must be hashable (element names, or tuples of words). Word lists are matched by
+    identity, so pass the same dict object (e.g. NICE_WORD_LISTS) and do not mutate it afterwards.
+
+    The returned instance is shared by every caller with the same configuration. Treat it as
+    read-only: changing an attribute such as delimiter changes encode/decode for all of them.
+    Its random state is shared too; use HRID(seed=...) directly when generate() must be
+    reproducible.
+
+    :param delimiter: The string used to join the elements of the ID.
+    :param elements: An iterable of element names. If not specified, DEFAULT_ELEMENTS will be used.
+    :param word_lists: An optional dictionary mapping element names to word lists.
+    :param scramble: If True, scramble sequential numbers to produce varied IDs.
+    :param scramble_seed: Seed for deterministic scramble multiplier selection.
+    :return: An HRID instance
+    """
+    if elements is not None:
+        elements = tuple(elements)
+    return _cached_hrid(delimiter, elements, _ByIdentity(word_lists), scramble, scramble_seed)
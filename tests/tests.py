@@ -1,3 +1,6 @@
+import copy
+import math
+import random
 import unittest
 from unittest import mock
 
@@ -53,6 +56,14 @@ class TestGenerateFunction(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.hrid.generate()
 
+    def test_generate_many_uses_choice_only(self):
+        self.hrid._elements = [['hello', 'hi'], ['world', 'earth']]
+        self.assertEqual(self.hrid.generate_many(2), ['hello, world', 'hello, world'])
+        self.assertEqual({name for name, _, _ in self.hrid.random.method_calls}, {'choice'})
+
+    def test_generate_many_zero(self):
+        self.assertEqual(self.hrid.generate_many(0), [])
+
 
 class TestCustomWordLists(unittest.TestCase):
 
@@ -159,11 +170,90 @@ class TestSeedReproducibility(unittest.TestCase):
         results2 = [h2.generate() for _ in range(10)]
         self.assertNotEqual(results1, results2)
 
+    def test_generate_many_matches_generate(self):
+        h1 = hrid.HRID(seed=12345)
+        h2 = hrid.HRID(seed=12345)
+        self.assertEqual(h1.generate_many(20), [h2.generate() for _ in range(20)])
+
+    def test_generate_many_matches_generate_with_custom_lists(self):
+        custom_lists = {'one': ['only'], 'three': ['a', 'b', 'c'], 'number': [str(i) for i in range(10, 99)]}
+        elements = ('one', 'three', 'number')
+        h1 = hrid.HRID(elements=elements, word_lists=custom_lists, seed=7)
+        h2 = hrid.HRID(elements=elements, word_lists=custom_lists, seed=7)
+        self.assertEqual(h1.generate_many(50), [h2.generate() for _ in range(50)])
+
+    def test_generate_many_matches_generate_with_random_subclass(self):
+        class CustomRandom(random.Random):
+            def random(self):
+                return super().random()
+
+        h1 = hrid.HRID(seed=7)
+        h2 = hrid.HRID(seed=7)
+        h1.random = CustomRandom(7)
+        h2.random = CustomRandom(7)
+        self.assertEqual(h1.generate_many(20), [h2.generate() for _ in range(20)])
+
     def test_seed_with_nice_word_lists(self):
         h1 = hrid.HRID(elements=('weather', 'tree'), word_lists=NICE_WORD_LISTS, seed=999)
         h2 = hrid.HRID(elements=('weather', 'tree'), word_lists=NICE_WORD_LISTS, seed=999)
         self.assertEqual(h1.generate(), h2.generate())
 
 
+class TestEncodeDecode(unittest.TestCase):
+
+    def test_scramble_inverse(self):
+        h = hrid.HRID(scramble_seed='model')
+        product = h._scramble_multiplier * h._scramble_inverse
+        self.assertEqual(product % h._space_size, 1)
+
+    def test_scramble_multiplier_coprime(self):
+        for seed in (None, 'model-a', 'model-b'):
+            h = hrid.HRID(scramble_seed=seed)
+            self.assertEqual(math.gcd(h._scramble_multiplier, h._space_size), 1)
+
+    def test_roundtrip(self):
+        h = hrid.HRID()
+        for n in (0, 1, 2, 12345, h.max_value):
+            self.assertEqual(h.decode(h.encode(n)), n)
+
+    def test_roundtrip_without_scramble(self):
+        h = hrid.HRID(scramble=False)
+        for n in (0, 1, 2, 12345, h.max_value):
+            self.assertEqual(h.decode(h.encode(n)), n)
+
+    def test_encode_out_of_range(self):
+        h = hrid.HRID()
+        with self.assertRaises(ValueError):
+            h.encode(-1)
+        with self.assertRaises(ValueError):
+            h.encode(h.max_value + 1)
+
+    def test_decode_unknown_word(self):
+        h = hrid.HRID()
+        with self.assertRaises(ValueError):
+            h.decode('not-a-real-word')
+
+
+class TestGetHrid(unittest.TestCase):
+
+    def test_same_config_returns_cached_instance(self):
+        h1 = hrid.get_hrid(scramble_seed='model-a')
+        h2 = hrid.get_hrid(scramble_seed='model-a')
+        self.assertIs(h1, h2)
+
+    def test_different_config_returns_different_instance(self):
+        h1 = hrid.get_hrid(scramble_seed='model-a')
+        h2 = hrid.get_hrid(scramble_seed='model-b')
+        h3 = hrid.get_hrid(scramble_seed='model-a', word_lists=NICE_WORD_LISTS)
+        self.assertIsNot(h1, h2)
+        self.assertIsNot(h1, h3)
+        self.assertIs(h3.word_lists, NICE_WORD_LISTS)
+
+    def test_matches_direct_construction(self):
+        h = hrid.get_hrid(elements=['adjective', 'noun'], scramble_seed='model-a')
+        direct = hrid.HRID(elements=['adjective', 'noun'], scramble_seed='model-a')
+        self.assertEqual(h.encode(42), direct.encode(42))
+
+
 if __name__ == '__main__':
     unittest.main()